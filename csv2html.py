@@ -2,9 +2,25 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import codecs
+import csv
+import functools
+import hashlib
+import io
+import os
 from pathlib import Path
 import re
+import shutil
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_object_dtype, is_string_dtype
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_pq
+except ImportError:  # pyarrow 는 선택 사항 (없으면 pandas 기본 엔진 사용)
+    pa = pa_csv = pa_pq = None
 
 
 def _normalize_key(s: str) -> str:
@@ -14,18 +30,123 @@ def _normalize_key(s: str) -> str:
     s = " ".join(s.strip().split())
     return s.lower()
 
+
+def to_numeric_column(s: pd.Series) -> pd.Series:
+    """숫자로 변환 (변환 불가 값은 NaN). 이미 숫자 dtype 이면 그대로 반환해 재파싱을 건너뛴다."""
+    if is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s, errors="coerce")
+
+
+def _normalize_key_series(s: pd.Series) -> pd.Series:
+    """
+    _normalize_key 의 컬럼 단위 버전 (결측값은 빈 문자열).
+    Arrow 정규식/lower 는 NBSP·전각 공백(U+3000)과 일부 유니코드 소문자 변환이 달라
+    스칼라 함수를 한 번의 리스트 순회로 그대로 적용한다.
+    """
+    keys = [_normalize_key(v) for v in s.astype(str).tolist()]
+    return pd.Series(keys, index=s.index, dtype=object)
+
+def read_csv_table(path: Path, usecols: list | None = None) -> pd.DataFrame:
+    """
+    pyarrow.csv 로 읽는다 (멀티스레드 파싱, 컬럼은 pyarrow dtype).
+    pyarrow 가 없거나 PyArrow 가 파싱하지 못하는 파일이면 pandas 기본 엔진으로 대체.
+    usecols 가 주어지면 해당 컬럼만 파싱한다.
+    """
+    if pa_csv is None:
+        return pd.read_csv(path, usecols=usecols)
+    # strings_can_be_null: 빈 칸/N/A/NA/null 등을 문자열 컬럼에서도 결측으로 (pd.read_csv 와 동일하게)
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, include_columns=usecols or [])
+    try:
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        return pd.read_csv(path, usecols=usecols)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_parquet_table(path: Path) -> pd.DataFrame:
+    """Parquet 을 pyarrow dtype backend 로 읽는다. (pyarrow 없으면 기본 설정)"""
+    try:
+        return pd.read_parquet(path, dtype_backend="pyarrow")
+    except ImportError:
+        return pd.read_parquet(path)
+
+
+def _file_signature(path: Path | None) -> tuple:
+    """캐시 키용 (mtime_ns, size). 파일이 없으면 (0, 0)"""
+    if path is None or not path.exists():
+        return (0, 0)
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _meta_sidecar_path(path: Path) -> Path:
+    """CSV 메타 파일 옆에 두는 정규화 결과 캐시 경로 (예: meta.csv -> meta.csv.parquet)"""
+    return path.with_suffix(path.suffix + ".parquet")
+
+
+# 사이드카 Parquet key-value 메타데이터에 저장하는 원본 식별 키
+_META_SIDECAR_KEY = b"csv2html_source"
+
+
+def _meta_sidecar_key(path: Path) -> bytes:
+    """원본 CSV 와 이 스크립트의 (mtime_ns, size) 로 만든 사이드카 유효성 키"""
+    return repr(_file_signature(path) + _file_signature(Path(__file__))).encode("ascii")
+
+
+def _read_meta_sidecar(path: Path) -> pd.DataFrame | None:
+    """
+    사이드카에 저장된 키가 원본 CSV / 스크립트의 현재 (mtime_ns, size) 와 정확히 같으면
+    정규화된 메타를 그대로 읽어 반환. 없거나 키가 다르거나 읽을 수 없으면 None.
+    """
+    sidecar = _meta_sidecar_path(path)
+    if pa_pq is None or not sidecar.exists():
+        return None
+    try:
+        table = pa_pq.read_table(sidecar)
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if (table.schema.metadata or {}).get(_META_SIDECAR_KEY) != _meta_sidecar_key(path):
+        return None
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _write_meta_sidecar(meta: pd.DataFrame, path: Path) -> None:
+    """정규화된 메타를 원본 키와 함께 Parquet 사이드카로 저장. (pyarrow 없음/쓰기 실패 시 조용히 건너뜀)"""
+    if pa_pq is None:
+        return
+    try:
+        table = pa.Table.from_pandas(meta, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), _META_SIDECAR_KEY: _meta_sidecar_key(path)}
+        pa_pq.write_table(table.replace_schema_metadata(metadata), _meta_sidecar_path(path), compression="zstd")
+    except (OSError, pa.ArrowException):
+        pass
+
+
+def _hash_match_keys(keys: pd.Series) -> np.ndarray:
+    """정규화된 매칭 키를 int64 해시로 변환 (dtype 과 무관하게 양쪽이 같은 값을 갖도록 object 로 해시)."""
+    return pd.util.hash_array(keys.to_numpy(dtype=object)).view(np.int64)
+
+
 def load_meta(path: Path) -> pd.DataFrame:
     """
     models_meta.(csv|parquet) 를 읽어 표준 스키마로 반환.
     필수 컬럼: Name, Input Resolution, Operations, Parameters
+    CSV 는 정규화 결과를 '<파일명>.parquet' 사이드카로 캐시하고, CSV 와 스크립트의 (mtime, size) 가 같으면 재사용한다.
     """
     if not path.exists():
         raise FileNotFoundError(f"Enrichment file not found: {path}")
 
-    if path.suffix.lower() == ".csv":
-        meta = pd.read_csv(path)
+    is_csv = path.suffix.lower() == ".csv"
+    if is_csv:
+        cached = _read_meta_sidecar(path)
+        if cached is not None:
+            return cached
+
+    if is_csv:
+        meta = read_csv_table(path)
     elif path.suffix.lower() in (".parquet", ".pq"):
-        meta = pd.read_parquet(path)
+        meta = read_parquet_table(path)
     else:
         raise ValueError("Unsupported enrichment format. Use CSV or Parquet.")
 
@@ -47,16 +168,19 @@ def load_meta(path: Path) -> pd.DataFrame:
         raise ValueError(f"Missing columns in enrichment: {missing}")
 
     # 키 정규화 컬럼 추가
-    meta["_match_key_"] = meta["Name"].astype(str).map(_normalize_key)
+    meta["_match_key_"] = _normalize_key_series(meta["Name"])
 
     # 중복 Name 정책: 마지막(가장 아래) 레코드가 우선
     meta = meta.drop_duplicates(subset=["_match_key_"], keep="last")
 
     # 타입 정리
-    meta["Operations"] = pd.to_numeric(meta["Operations"], errors="coerce")
-    meta["Parameters"] = pd.to_numeric(meta["Parameters"], errors="coerce")
+    meta["Operations"] = to_numeric_column(meta["Operations"])
+    meta["Parameters"] = to_numeric_column(meta["Parameters"])
 
-    return meta[["_match_key_", "Input Resolution", "Operations", "Parameters"]]
+    meta = meta[["_match_key_", "Input Resolution", "Operations", "Parameters"]]
+    if is_csv:
+        _write_meta_sidecar(meta, path)
+    return meta
 
 
 # ----------------------------
@@ -94,91 +218,159 @@ FINAL_COLUMNS = [
     "Source", "Compiled", "onnx", "json"
 ]
 
+# 메타 파일로 보강하는 컬럼 (CSV 값이 비어 있을 때만 채움)
+META_FILL_COLUMNS = ("Input Resolution", "Operations", "Parameters")
+
+# 숫자 컬럼 표시 포맷 (천 단위 구분자 포함)
+NUMBER_FORMATS = {"Operations": ",.2f", "Parameters": ",.2f", "FPS": ",.0f", "FPS/Watt": ",.2f"}
+
 LINK_COLUMNS = ["Source", "Compiled", "onnx", "json"]
 LINK_TEXT_MAP = {"Source": "Source", "Compiled": "Compiled", "onnx": "onnx", "json": "json"}
 
 
-def create_html_link(url: str, text: str) -> str:
+def format_number_series(s: pd.Series, spec: str) -> pd.Series:
     """
-    URL과 링크 텍스트(종류)를 받아 적절한 아이콘이 포함된 HTML 앵커 태그를 생성한다.
-    - text가 'Source'이면 바로가기 아이콘, 그 외에는 다운로드 아이콘을 사용한다.
+    숫자 Series 를 spec 포맷 문자열로 변환 (결측값은 빈 문자열).
+    결측이 아닌 값만 골라 한 번에 포맷한다 (셀마다 lambda / pd.notna 호출 없음).
     """
-    if not isinstance(url, str) or not url.strip():
-        return ""
+    values = s.to_numpy(dtype=float, na_value=np.nan)
+    mask = ~np.isnan(values)
+    out = np.full(len(values), "", dtype=object)
+    if mask.any():
+        # numpy scalar 대신 파이썬 float 리스트로 포맷 (셀마다 박싱 없음)
+        out[mask] = [format(x, spec) for x in values[mask].tolist()]
+    return pd.Series(out, index=s.index, dtype=object)
 
-    # 1. "바로가기" 아이콘 (External Link) SVG 코드 ↗️
-    external_link_svg = """
+
+# 링크로 만들 값: 앞뒤 공백을 허용하는 http(s) URL
+_URL_RE = re.compile(r'^\s*https?://', re.IGNORECASE)
+
+# 1. "바로가기" 아이콘 (External Link) SVG 코드 ↗️
+EXTERNAL_LINK_SVG = """
     <svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
         <path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"></path>
         <polyline points="15 3 21 3 21 9"></polyline>
         <line x1="10" y1="14" x2="21" y2="3"></line>
     </svg>
-    """
+""".strip()
 
-    # 2. "다운로드" 아이콘 SVG 코드 📥
-    download_svg = """
+# 2. "다운로드" 아이콘 SVG 코드 📥
+DOWNLOAD_SVG = """
     <svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
         <path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"></path>
         <polyline points="7 10 12 15 17 10"></polyline>
         <line x1="12" y1="15" x2="12" y2="3"></line>
     </svg>
-    """
+""".strip()
 
-    # 3. text 값에 따라 사용할 아이콘을 선택
-    icon_svg = ""
-    if text == "Source":
-        icon_svg = external_link_svg
-    else:
-        icon_svg = download_svg
 
-    # 4. 최종 HTML 태그를 생성하여 반환
-    return f'<a href="{url}" target="_blank" rel="noopener noreferrer" title="{text}">{icon_svg.strip()}</a>'
+def _build_link_tail(text: str) -> str:
+    """href 값 뒤에 붙는 앵커 태그 나머지 부분 (text가 'Source'이면 바로가기, 그 외에는 다운로드 아이콘)"""
+    icon_svg = EXTERNAL_LINK_SVG if text == "Source" else DOWNLOAD_SVG
+    return f'" target="_blank" rel="noopener noreferrer" title="{text}">{icon_svg}</a>'
 
 
-def get_metric_type(value) -> str:
+# 링크 종류별 앵커 태그 꼬리는 import 시점에 미리 만들어 둔다
+LINK_TAILS = {text: _build_link_tail(text) for text in LINK_TEXT_MAP.values()}
+
+
+def _link_tail(text: str) -> str:
+    """미리 만든 앵커 꼬리를 반환 (LINK_TEXT_MAP 에 없는 text 는 그때 생성)"""
+    return LINK_TAILS.get(text) or _build_link_tail(text)
+
+
+def create_html_link(url: str, text: str) -> str:
     """
-    Metric 대분류 (테이블의 'Metric' 컬럼용)
+    URL과 링크 텍스트(종류)를 받아 적절한 아이콘이 포함된 HTML 앵커 태그를 생성한다.
+    - text가 'Source'이면 바로가기 아이콘, 그 외에는 다운로드 아이콘을 사용한다.
+    - http(s) URL 이 아니면 (빈 값, '#REF!' 같은 엑셀 오류 등) 빈 문자열을 반환한다.
     """
-    if not isinstance(value, str):
+    if not isinstance(url, str) or not _URL_RE.match(url):
         return ""
-    s = value.strip()
-    if s.startswith("Top1"):
-        return "Top1"
-    if s.startswith("mAP"):
-        return "mAP50" if "50" in s or "0.5" in s else "mAP"
-    if s.startswith("mIoU"):
-        return "mIoU"
-    if s.startswith("Avg PSNR") or s.startswith("PSNR") or "SSIM" in s:
-        return "PSNR/SSIM"
-    if s.startswith("Val AP") or s.startswith("AP(") or s.startswith("AP ") or s.startswith("AP"):
-        return "AP(Easy/Med/Hard)"
-    return ""
+    return '<a href="' + url.strip() + _link_tail(text)
 
 
-def get_metric_detail(value) -> str:
+def create_html_link_series(urls: pd.Series, text: str) -> pd.Series:
+    """
+    create_html_link 의 컬럼 단위 버전. http(s) URL 이 아닌 셀은 빈 문자열이 된다.
+    """
+    if not (is_string_dtype(urls) or is_object_dtype(urls)):
+        # 숫자 / 전부 빈 컬럼(null[pyarrow]) 등 문자열이 아닌 dtype 은 링크가 될 수 없다
+        return pd.Series("", index=urls.index, dtype=object)
+    valid = urls.str.match(_URL_RE.pattern, case=False).fillna(False).astype(bool).to_numpy()
+    out = np.full(len(urls), "", dtype=object)
+    if valid.any():
+        # 유효한 URL 만 골라 한 번의 문자열 연결로 앵커를 만든다 (Arrow 문자열이면 C++ 커널)
+        anchors = '<a href="' + urls[valid].astype(str).str.strip() + _link_tail(text)
+        out[valid] = anchors.to_numpy(dtype=object)
+    return pd.Series(out, index=urls.index, dtype=object)
+
+
+# ---- Metric 분류 -------------------------------------------------
+# 한 번의 match 로 Metric 대분류를 태깅한다. 대안은 기존 if 체인과 같은 순서로 시도되며,
+# 어떤 대안에도 해당하지 않으면 마지막 빈 대안이 매칭되어 모든 그룹이 None 이 된다.
+# AP(Easy/Medium/Hard), mAP@0.5 세부 라벨은 선행 lookahead 그룹으로 함께 잡는다.
+_METRIC_CLASSIFIER = re.compile(
+    r'^(?=(?P<ap_easy>.*?AP\(Easy\))?)'
+    r'(?=(?P<ap_medium>.*?AP\(Medium\))?)'
+    r'(?=(?P<ap_hard>.*?AP\(Hard\))?)'
+    r'(?=(?P<ssim>.*?SSIM)?)'
+    r'(?=(?P<map050>mAP@0\.5|.*?mAP50)?)'
+    r'(?:(?P<top1>Top1)'
+    r'|(?P<map50>mAP(?=.*?(?:50|0\.5)))'
+    r'|(?P<map>mAP)'
+    r'|(?P<miou>mIoU)'
+    r'|(?P<psnr>Avg PSNR|PSNR|.*?SSIM)'
+    r'|(?P<ap>Val AP|AP)'
+    r'|)',
+    re.DOTALL,
+)
+
+# 분류 그룹 -> (대분류, 세부 라벨)
+_METRIC_LABELS = {
+    "top1":  ("Top1", "Top1"),
+    "map50": ("mAP50", "mAP"),
+    "map":   ("mAP", "mAP"),
+    "miou":  ("mIoU", ""),
+    "psnr":  ("PSNR/SSIM", "PSNR/SSIM"),
+    "ap":    ("AP(Easy/Med/Hard)", "AP"),
+}
+
+
+def classify_metric(value) -> tuple:
     """
-    Metric 세부 라벨: AP(Easy)/AP(Medium)/AP(Hard) 등 구분
+    Metric 문자열을 (대분류, 세부 라벨) 튜플로 분류한다.
+    - 대분류: 테이블의 'Metric' 컬럼용 (Top1 / mAP50 / mAP / mIoU / PSNR/SSIM / AP(Easy/Med/Hard))
+    - 세부 라벨: AP(Easy)/AP(Medium)/AP(Hard), mAP@0.5 등 구분
     """
     if not isinstance(value, str):
-        return ""
-    s = value.strip()
-    if "AP(Easy)" in s:
-        return "AP(Easy)"
-    if "AP(Medium)" in s:
-        return "AP(Medium)"
-    if "AP(Hard)" in s:
-        return "AP(Hard)"
-    if s.startswith("Top1"):
-        return "Top1"
-    if s.startswith("mAP@0.5") or "mAP50" in s:
-        return "mAP@0.5"
-    if s.startswith("mAP"):
-        return "mAP"
-    if s.startswith("Avg PSNR") or s.startswith("PSNR") or "SSIM" in s:
-        return "PSNR/SSIM"
-    if s.startswith("Val AP") or s.startswith("AP(") or s.startswith("AP ") or s.startswith("AP"):
-        return "AP"
-    return ""
+        return "", ""
+    m = _METRIC_CLASSIFIER.match(value.strip())
+    # 분류 그룹은 lookahead 그룹보다 뒤에서 닫히므로 lastgroup 이 곧 분류 결과
+    kind = m.lastgroup
+    major, detail = _METRIC_LABELS.get(kind, ("", ""))
+    # 세부 라벨 우선순위: AP(Easy) > AP(Medium) > AP(Hard) > Top1 > mAP@0.5 > ... > SSIM
+    if m.group("ap_easy") is not None:
+        detail = "AP(Easy)"
+    elif m.group("ap_medium") is not None:
+        detail = "AP(Medium)"
+    elif m.group("ap_hard") is not None:
+        detail = "AP(Hard)"
+    elif m.group("map050") is not None and kind != "top1":
+        detail = "mAP@0.5"
+    elif kind == "miou" and m.group("ssim") is not None:
+        detail = "PSNR/SSIM"
+    return major, detail
+
+
+def get_metric_type(value) -> str:
+    """Metric 대분류 (테이블의 'Metric' 컬럼용)"""
+    return classify_metric(value)[0]
+
+
+def get_metric_detail(value) -> str:
+    """Metric 세부 라벨: AP(Easy)/AP(Medium)/AP(Hard) 등 구분"""
+    return classify_metric(value)[1]
 
 
 # ---- Accuracy 숫자 추출(요청 규칙) -------------------------------
@@ -187,6 +379,13 @@ _MAP_MAIN  = re.compile(r'\bmAP\b(?!\s*@?\s*0?\.?5|50)\s*[:=]?\s*([-+]?\d+(?:\.\
 _MAP_050   = re.compile(r'\bmAP(?:@?\s*0?\.?5|50)\b\s*[:=]?\s*([-+]?\d+(?:\.\d+)?)', re.IGNORECASE)
 _FIRST_NUM = re.compile(r'([-+]?\d+(?:\.\d+)?)')
 
+# 위 4개 패턴을 우선순위 순서의 lookahead 대안으로 묶은 단일 패턴.
+# 문자열 시작에서 한 번만 match 하며, 매칭된 첫 그룹(1~4)이 우선순위가 가장 높은 값이다.
+_PRIMARY_ACC_RE = re.compile(
+    "^(?:" + "|".join(f"(?=.*?{p.pattern})" for p in (_TOP1_RE, _MAP_MAIN, _MAP_050, _FIRST_NUM)) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
+
 _AP_PREAMBLE_RE = re.compile(r'\b(?:Val\s*)?AP\b', re.IGNORECASE)
 _AP_PAIR_RE     = re.compile(r'\b(Easy|Medium|Hard)\b\s*[:=]?\s*([-+]?\d+(?:\.\d+)?)', re.IGNORECASE)
 _AP_FUNC_RE     = re.compile(r'AP\((Easy|Medium|Hard)\)\s*[:=]?\s*([-+]?\d+(?:\.\d+)?)', re.IGNORECASE)
@@ -263,120 +462,170 @@ def extract_primary_accuracy(value) -> str:
     """
     if not isinstance(value, str):
         return ""
-    s = value.strip()
-    for pat in (_TOP1_RE, _MAP_MAIN, _MAP_050, _FIRST_NUM):
-        m = pat.search(s)
-        if m:
-            return m.group(1)
-    return ""
+    m = _PRIMARY_ACC_RE.match(value.strip())
+    if not m:
+        return ""
+    return next((g for g in m.groups() if g is not None), "")
 # ------------------------------------------------------------------
 
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    object / str dtype 컬럼을 'string[pyarrow]' 로 변환 (중복 라벨이 있어도 위치 기준으로 처리).
+    PyArrow 엔진이 전부 빈 컬럼에 붙이는 null[pyarrow] 도 문자열 컬럼으로 취급한다.
+    pyarrow 가 없으면 그대로 반환.
+    """
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if col.dtype == "string[pyarrow]":
+            continue
+        is_null = isinstance(col.dtype, pd.ArrowDtype) and str(col.dtype) == "null[pyarrow]"
+        if is_null or is_object_dtype(col) or is_string_dtype(col):
+            try:
+                df.isetitem(i, col.astype("string[pyarrow]"))
+            except ImportError:
+                return df
+    return df
+
+
 def _lower_alias_map(alias_map: dict) -> dict:
     """케이스 무관 매핑을 위해 소문자 키로 변환한 alias 맵을 만든다."""
     return {str(k).strip().lower(): v for k, v in alias_map.items()}
 
 
+# Task 정리: 앞 번호("1. ") 제거 + 앞뒤 공백 제거를 한 번의 치환으로
+_TASK_CLEAN_RE = re.compile(r"^(?:\d+\.)?\s*|\s+$")
+
+# 케이스 무관 alias 맵은 import 시 한 번만 만든다
+_LOWER_ALIAS = _lower_alias_map(COLUMN_ALIAS_MAP)
+
+# 입력 CSV 에서 실제로 읽을 컬럼 (소문자): alias 대상 + 최종 컬럼 + Name 보강용 filename
+_USED_COLUMN_KEYS = frozenset(_LOWER_ALIAS) | {c.lower() for c in FINAL_COLUMNS} | {"filename"}
+
+
+@functools.lru_cache(maxsize=16)
+def _rename_plan(columns: tuple) -> dict:
+    """
+    입력 헤더(튜플) -> 표준 컬럼명 rename 맵.
+    같은 스키마의 CSV 를 반복 처리할 때는 캐시된 맵을 그대로 사용한다.
+    """
+    lowered = ((c, c.lower()) for c in columns)
+    return {c: _LOWER_ALIAS[key] for c, key in lowered if key in _LOWER_ALIAS}
+
+
 def dedupe_and_bfill_column(df: pd.DataFrame, colname: str) -> pd.DataFrame:
     """
     동일 라벨이 여러 번 생겼을 때 좌→우 우선으로 bfill하여 하나로 병합.
     """
-    cols = df.filter(regex=fr"^{re.escape(colname)}$", axis=1)
-    if cols.shape[1] > 1:
-        merged = cols.bfill(axis=1).iloc[:, 0]
-        extra = list(cols.columns[1:])
-        df.drop(columns=extra, inplace=True)
+    positions = [i for i, c in enumerate(df.columns) if c == colname]
+    if len(positions) > 1:
+        merged = df.iloc[:, positions].bfill(axis=1).iloc[:, 0]
+        df.drop(columns=colname, inplace=True)
         df[colname] = merged
     return df
 
 
-def _metric_accuracy_parsor(df: pd.DataFrame) -> pd.DataFrame:
+_DECIMAL_RE = re.compile(r'(\d+\.\d+)')
+
+_AP_KEYS   = ("Easy", "Medium", "Hard")
+_PSNR_KEYS = ("PSNR", "SSIM")
+
+# 여러 값을 갖는 Metric 대분류: (대분류, Metric 딕셔너리 키, Accuracy 딕셔너리 키)
+_MULTI_VALUE_METRICS = (
+    ("AP(Easy/Med/Hard)", ("AP(Easy)", "AP(Med)", "AP(Hard)"), _AP_KEYS),
+    ("PSNR/SSIM",         ("PSNR", "SSIM"),                     _PSNR_KEYS),
+)
+
+
+def _metric_type_series(s: pd.Series) -> pd.Series:
     """
-    Metric, Accuracy 값을 원하는 형태로 변환
+    get_metric_type 의 벡터화 버전: _METRIC_CLASSIFIER 를 컬럼 전체에 한 번만 적용
     """
-    out_rows = []
-    for _, row in df.iterrows():
-        raw_str = str(row.get("Raw Accuracy", ""))
-        npu_str = str(row.get("NPU Accuracy", ""))
+    groups = s.str.extract(_METRIC_CLASSIFIER)
+    conds = [groups[k].notna().to_numpy() for k in _METRIC_LABELS]
+    choices = [major for major, _ in _METRIC_LABELS.values()]
+    return pd.Series(np.select(conds, choices, default=""), index=s.index, dtype=object)
 
-        # 그대로 유지 (단, 숫자만 남기고 Metric/세부 라벨 정리)
-        major = get_metric_type(raw_str)
-        row = row.copy()
 
-        # Metric 컬럼을 딕셔너리 형태로 저장
-        if major == "AP(Easy/Med/Hard)":
-            row["Metric"] = {
-                "AP(Easy)": "",
-                "AP(Med)": "",
-                "AP(Hard)": ""
-            }
-        elif major == "PSNR/SSIM":
-            row["Metric"] = {
-                "PSNR": "",
-                "SSIM": ""
-            }
-        else:
-            row["Metric"] = major
-
-        if major == "AP(Easy/Med/Hard)":
-            # AP 값 3개를 분리
-            raw_vals = re.findall(r'(\d+\.\d+)', raw_str)
-            npu_vals = re.findall(r'(\d+\.\d+)', npu_str)
-
-            # HTML 포맷에 맞게 저장 (나중에 HTML 생성 함수에서 사용)
-            row["Raw Accuracy"] = {
-                "Easy": raw_vals[0] if len(raw_vals) > 0 else "",
-                "Medium": raw_vals[1] if len(raw_vals) > 1 else "",
-                "Hard": raw_vals[2] if len(raw_vals) > 2 else ""
-            }
-            row["NPU Accuracy"] = {
-                "Easy": npu_vals[0] if len(npu_vals) > 0 else "",
-                "Medium": npu_vals[1] if len(npu_vals) > 1 else "",
-                "Hard": npu_vals[2] if len(npu_vals) > 2 else ""
-            }
+def _primary_accuracy_series(s: pd.Series) -> pd.Series:
+    """
+    extract_primary_accuracy 의 벡터화 버전 (우선순위 동일)
+    """
+    groups = s.str.extract(_PRIMARY_ACC_RE)
+    # 앞 그룹일수록 우선순위가 높다. (bfill(axis=1) 은 Arrow 문자열에서 전치가 일어나 매우 느림)
+    # fillna 대신 mask 로 합친다 (pandas 2.2 의 object fillna 다운캐스트 FutureWarning 회피)
+    out = groups[0]
+    for col in groups.columns[1:]:
+        out = out.mask(out.isna(), groups[col])
+    return out.astype(object).mask(out.isna(), "")
 
-        elif major == "PSNR/SSIM":
-            # PSNR/SSIM 값을 분리
-            raw_vals = re.findall(r'(\d+\.\d+)', raw_str)
-            npu_vals = re.findall(r'(\d+\.\d+)', npu_str)
 
-            # HTML 포맷에 맞게 저장
-            row["Raw Accuracy"] = {
-                "PSNR": raw_vals[0] if len(raw_vals) > 0 else "",
-                "SSIM": raw_vals[1] if len(raw_vals) > 1 else ""
-            }
-            row["NPU Accuracy"] = {
-                "PSNR": npu_vals[0] if len(npu_vals) > 0 else "",
-                "SSIM": npu_vals[1] if len(npu_vals) > 1 else ""
-            }
+def _split_decimals(s: pd.Series, keys: tuple) -> list:
+    """
+    각 셀의 소수 값을 앞에서부터 keys 개수만큼 뽑아 {key: value} 딕셔너리 리스트로 반환
+    """
+    vals = s.str.extractall(_DECIMAL_RE)[0].unstack()
+    vals = vals.reindex(index=s.index, columns=range(len(keys))).fillna("")
+    return [dict(zip(keys, row)) for row in vals.itertuples(index=False, name=None)]
 
-        else:
-            # 단일 값만 있는 경우 그대로 유지
-            row["Raw Accuracy"] = extract_primary_accuracy(raw_str)
-            row["NPU Accuracy"] = extract_primary_accuracy(npu_str)
-        out_rows.append(row)
 
-    return pd.DataFrame(out_rows)
+def _metric_accuracy_parsor(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Metric, Accuracy 값을 원하는 형태로 변환 (행 단위 루프 없이 컬럼 단위로 처리)
+    """
+    def _as_str(col: str) -> pd.Series:
+        if col not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        return df[col].astype(str)
+
+    # 앞뒤 공백은 한 번만 제거해 두고 아래 분류/추출에서 같이 사용
+    raw = _as_str("Raw Accuracy").str.strip()
+    npu = _as_str("NPU Accuracy").str.strip()
+
+    metric = _metric_type_series(raw)
+    raw_out = pd.Series("", index=df.index, dtype=object)
+    npu_out = pd.Series("", index=df.index, dtype=object)
+
+    # AP 값 3개 / PSNR, SSIM 값 2개는 딕셔너리로 저장 (HTML 생성 함수에서 분할 표시)
+    single = np.ones(len(df), dtype=bool)
+    for major, metric_keys, value_keys in _MULTI_VALUE_METRICS:
+        mask = (metric == major).to_numpy()
+        if not mask.any():
+            continue
+        single &= ~mask
+        metric[mask] = [dict.fromkeys(metric_keys, "") for _ in range(mask.sum())]
+        raw_out[mask] = _split_decimals(raw[mask], value_keys)
+        npu_out[mask] = _split_decimals(npu[mask], value_keys)
+
+    # 단일 값인 경우 숫자 하나만 남긴다 (나머지 행만 대상으로 한 번씩 계산)
+    if single.any():
+        raw_out[single] = _primary_accuracy_series(raw[single])
+        npu_out[single] = _primary_accuracy_series(npu[single])
+
+    return df.assign(**{"Metric": metric, "Raw Accuracy": raw_out, "NPU Accuracy": npu_out})
 
 
 def normalize_and_process(df: pd.DataFrame, meta_path: Path | None = None) -> pd.DataFrame:
     """
     DataFrame 컬럼 표준화 + 파생 컬럼 생성 + 링크/숫자 포맷팅 적용
     """
-    df = df.copy()
+    # 0) 헤더 공백 제거 (새 DataFrame 을 돌려받으므로 입력은 변경되지 않음)
+    df = df.set_axis([str(c).strip() for c in df.columns], axis=1)
 
-    # 0) 헤더 공백 제거
-    df.columns = [str(c).strip() for c in df.columns]
+    # 0-1) 문자열 컬럼은 Arrow 기반 string dtype 으로 (이후 .str 연산이 Arrow C++ 커널에서 실행)
+    df = to_arrow_strings(df)
 
-    # 1) Task 정리
+    # 1) Task 정리 (빈 값/결측은 리더와 무관하게 "Uncategorized Models" 로)
     if "Task" in df.columns:
-        df["Task"] = df["Task"].astype(str).str.replace(r"^\d+\.\s*", "", regex=True).str.strip()
+        task = df["Task"].where(df["Task"].notna(), "").astype(str).str.replace(_TASK_CLEAN_RE, "", regex=True)
+        df["Task"] = task.mask(task == "", "Uncategorized Models")
     else:
         df["Task"] = "Uncategorized Models"
 
+    # Task 는 등장 순서를 카테고리 순서로 갖는 category dtype (그룹핑 시 정수 코드 비교)
+    df["Task"] = pd.Categorical(df["Task"], categories=pd.unique(df["Task"].dropna()), ordered=True)
+
     # 2) 컬럼 이름 표준화(케이스 무관 rename)
-    lower_alias = _lower_alias_map(COLUMN_ALIAS_MAP)
-    rename_map = {c: lower_alias[c.lower()] for c in df.columns if c.lower() in lower_alias}
-    df.rename(columns=rename_map, inplace=True)
+    df.rename(columns=_rename_plan(tuple(df.columns)), inplace=True)
 
     # 2-1) Name/License 중복 라벨 병합
     df = dedupe_and_bfill_column(df, "Name")
@@ -405,130 +654,136 @@ def normalize_and_process(df: pd.DataFrame, meta_path: Path | None = None) -> pd
     #    df["NPU Accuracy"] = ""
     df = _metric_accuracy_parsor(df)
 
-    # 5) 필수 컬럼 보강
-    for col in FINAL_COLUMNS:
-        if col not in df.columns:
-            df[col] = ""
+    # 5) 최종 컬럼은 dict 에 모으고 마지막에 DataFrame 을 한 번만 만든다 (없는 컬럼은 빈 문자열)
+    empty_col = pd.Series("", index=df.index, dtype=object)
+    cols = {col: df[col] if col in df.columns else empty_col for col in FINAL_COLUMNS}
 
     # 6) 링크 컬럼 앵커 처리
     for col in LINK_COLUMNS:
-        df.loc[:, col] = df[col].apply(lambda url: create_html_link(url, LINK_TEXT_MAP[col]))
+        cols[col] = create_html_link_series(cols[col], LINK_TEXT_MAP[col])
 
     # 7) 숫자 포맷팅
-    for col in ["Operations", "Parameters", "FPS", "FPS/Watt"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df["Operations"] = df["Operations"].map(lambda x: f"{x:,.2f}" if pd.notna(x) else "")
-    df["Parameters"] = df["Parameters"].map(lambda x: f"{x:,.2f}" if pd.notna(x) else "")
-    df["FPS"] = df["FPS"].map(lambda x: f"{x:,.0f}" if pd.notna(x) else "")
-    df["FPS/Watt"] = df["FPS/Watt"].map(lambda x: f"{x:,.2f}" if pd.notna(x) else "")
-
-    if "Name" not in df.columns:
-        df["Name"] = "N/A"
-    df["_match_key_"] = df["Name"].astype(str).map(_normalize_key)
-
-    if "License" in df.columns:
-        df["License"] = df["License"].fillna("Not Specified")
-        df.loc[df["License"].astype(str).str.strip() == "", "License"] = "Not Specified"
+    for col, spec in NUMBER_FORMATS.items():
+        cols[col] = format_number_series(to_numeric_column(cols[col]), spec)
 
+    license_col = cols["License"].fillna("Not Specified")
+    cols["License"] = license_col.mask(license_col.astype(str).str.strip() == "", "Not Specified")
 
     # --- 외부 보강 파일이 있으면 Left Join ---
     if meta_path is not None:
         meta = load_meta(meta_path)
-        df = df.merge(meta, on="_match_key_", how="left", suffixes=("", "_meta"))
-
-        # CSV에 없던 값만 메타로 채우기(기존값이 비었을 때만 덮어쓰기)
-        def _fill_if_empty(base_col: str, meta_col: str):
-            if base_col not in df.columns:
-                df[base_col] = ""
-            df[base_col] = df[base_col].where(df[base_col].astype(str).str.len() > 0, df[meta_col])
 
-        _fill_if_empty("Input Resolution", "Input Resolution_meta")
-        _fill_if_empty("Operations",       "Operations_meta")
-        _fill_if_empty("Parameters",       "Parameters_meta")
+        # 문자열 키 대신 64bit 해시 키로 조회 (매칭된 행은 원래 키가 같은지 확인)
+        match_key = _normalize_key_series(cols["Name"])
+        # set_index(pd.Index(...)) 는 원소 2개짜리 int64 를 RangeIndex 로 바꾸려다 step 오버플로로 비어 버릴 수 있어
+        # ndarray 를 그대로 축 라벨로 지정한다
+        meta = meta.set_axis(_hash_match_keys(meta["_match_key_"]), axis=0)
+        found = meta.reindex(_hash_match_keys(match_key)).set_axis(df.index)
+        matched = found["_match_key_"].notna()
+        assert match_key[matched].eq(found.loc[matched, "_match_key_"]).all(), "match key hash collision"
 
-        # 메타 컬럼은 정리
-        df.drop(columns=[c for c in df.columns if c.endswith("_meta")], inplace=True)
+        # CSV에 없던 값만 메타로 채우기(기존값이 비었을 때만 덮어쓰기)
+        # (숫자로 읽힌 int64[pyarrow] 컬럼 등에 메타 문자열을 쓸 수 있도록 object 로 변환 후 채움)
+        for col in META_FILL_COLUMNS:
+            base = cols[col].astype(object)
+            cols[col] = base.mask(base.isna() | base.astype(str).eq(""), found[col])
 
     # 8) 최종 컬럼 순서
-    df = df[FINAL_COLUMNS]
-    return df
+    return pd.DataFrame(cols, columns=FINAL_COLUMNS)
 
 
 # --- 새롭게 추가된 HTML 테이블 생성 함수 ---
+# 텍스트 셀 이스케이프용 변환 테이블 (str.translate 한 번으로 처리)
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# 여러 값(dict)을 <div>로 분할해서 표시하는 컬럼
+DIV_COLUMNS = ("Metric", "Raw Accuracy", "NPU Accuracy")
+
+
+def _column_cells_html(col_name: str, values: np.ndarray) -> list:
+    """
+    한 컬럼의 값들을 <td> 셀 HTML 리스트로 변환한다.
+    """
+    present = pd.notna(values)
+
+    # Metric, Raw Accuracy, NPU Accuracy 컬럼에 대한 특별 처리
+    if col_name in DIV_COLUMNS:
+        show_key = col_name == "Metric"
+        cells = []
+        for value, ok in zip(values, present):
+            if isinstance(value, dict):
+                # 여러 값으로 구성된 딕셔너리인 경우, div로 분할하여 표시
+                items = value.keys() if show_key else value.values()
+                cells.append("<td>" + "".join(f"<div>{v}</div>" for v in items) + "</td>")
+            elif ok:
+                # 단일 값인 경우 그대로 표시
+                cells.append(f"<td><div>{value}</div></td>")
+            else:
+                cells.append("<td></td>")
+        return cells
+
+    # 링크 컬럼은 이미 앵커 HTML 이므로 그대로
+    if col_name in LINK_COLUMNS:
+        return [f"<td>{value}</td>" if ok else "<td></td>" for value, ok in zip(values, present)]
+
+    # 그 외 컬럼은 일반 텍스트: &, <, > 를 이스케이프해서 표시
+    return [f"<td>{str(value).translate(_HTML_ESCAPE)}</td>" if ok else "<td></td>"
+            for value, ok in zip(values, present)]
+
+
 def dataframe_to_html_table(df: pd.DataFrame) -> str:
     """
     DataFrame을 HTML 테이블 문자열로 변환 (커스텀 렌더링 포함)
+    - 컬럼 단위로 셀 HTML 을 만든 뒤 행으로 묶는다 (iterrows / to_html 미사용)
     """
     headers = [f'<th>{col}</th>' for col in df.columns]
     thead = f'<thead><tr>{"".join(headers)}</tr></thead>'
-    
-    tbody = []
-    for _, row in df.iterrows():
-        cells = []
-        for col_name in df.columns:
-            value = row[col_name]
-            cell_content = ""
-
-            # Metric, Raw Accuracy, NPU Accuracy 컬럼에 대한 특별 처리
-            if col_name in ["Metric", "Raw Accuracy", "NPU Accuracy"]:
-                if isinstance(value, dict):
-                    # 여러 값으로 구성된 딕셔너리인 경우, div로 분할하여 표시
-                    divs = []
-                    for key, val in value.items():
-                        if col_name == "Metric":
-                            divs.append(f'<div>{key}</div>')
-                        else:
-                            divs.append(f'<div>{val}</div>')
-                    cell_content = "".join(divs)
-                elif pd.notna(value):
-                    # 단일 값인 경우 그대로 표시
-                    cell_content = f'<div>{value}</div>'
-            else:
-                # 그 외 컬럼은 일반적인 처리
-                cell_content = str(value) if pd.notna(value) else ""
 
-            cells.append(f'<td>{cell_content}</td>')
-        tbody.append(f'<tr>{"".join(cells)}</tr>')
-    
+    columns = [_column_cells_html(col, df[col].to_numpy(dtype=object)) for col in df.columns]
+    tbody = ["<tr>" + "".join(row) + "</tr>" for row in zip(*columns)]
+
     tbody_html = f'<tbody>{"".join(tbody)}</tbody>'
     return f'<table class="model-zoo-table">{thead}{tbody_html}</table>'
 
 
-def dataframe_grouped_html(df: pd.DataFrame) -> str:
+def iter_grouped_sections(df: pd.DataFrame):
     """
-    Task 순서대로 섹션(<h2>) + 테이블(각각에 Task 컬럼 포함) HTML 생성
+    Task 순서대로 섹션(<h2>) + 테이블(각각에 Task 컬럼 포함) HTML 을 하나씩 생성 (generator)
     """
-    parts = []
-    task_order = df["Task"].astype(str).tolist() if "Task" in df.columns else []
-    task_order = pd.Series(task_order).drop_duplicates().tolist() if task_order else ["Uncategorized Models"]
+    if "Task" in df.columns and df["Task"].notna().any():
+        groups = df.groupby("Task", sort=False, observed=True)
+    else:
+        groups = [("Uncategorized Models", df)]
 
-    for task in task_order:
-        sub = df[df["Task"] == task].copy()
+    # 한 번의 분할로 Task 별 서브 테이블을 얻는다 (sort=False 로 등장 순서 유지)
+    for task, sub in groups:
         if sub.empty:
             continue
-        parts.append(f'<h2 class="task-title">{task}</h2>')
-        
+
         # 'Task' 컬럼은 더 이상 필요 없으므로 드롭
-        sub.drop(columns=["Task"], inplace=True)
-        
-        table_html = dataframe_to_html_table(sub)
-        parts.append(f'<div class="table-container">{table_html}</div>')
+        sub = sub.drop(columns=["Task"], errors="ignore")
 
-    return "\n".join(parts)
+        table_html = dataframe_to_html_table(sub)
+        title = str(task).translate(_HTML_ESCAPE)
+        yield f'<h2 class="task-title">{title}</h2>\n<div class="table-container">{table_html}</div>'
 
 
-def build_full_html(body: str) -> str:
+def dataframe_grouped_html(df: pd.DataFrame) -> str:
     """
-    전체 HTML 문서 스켈레톤 + 스타일
+    Task 순서대로 섹션(<h2>) + 테이블(각각에 Task 컬럼 포함) HTML 생성
     """
-    return f"""<!DOCTYPE html>
+    return "\n".join(iter_grouped_sections(df))
+
+
+# 전체 HTML 문서 스켈레톤 + 스타일 (본문 앞/뒤)
+HTML_HEAD = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
     <title>DX Model Zoo</title>
     <style>
-        :root {{
+        :root {
             --bg: #f8f9fa;
             --fg: #212529;
             --muted: #495057;
@@ -536,105 +791,215 @@ def build_full_html(body: str) -> str:
             --accent: #0d6efd;
             --card: #ffffff;
             --thead: #e9ecef;
-        }}
-        * {{ box-sizing: border-box; }}
-        body {{
+        }
+        * { box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
             margin: 0;
             padding: 24px;
             background: var(--bg);
             color: var(--fg);
             line-height: 1.5;
-        }}
-        h1 {{
+        }
+        h1 {
             margin: 0 0 28px 0;
             font-size: 2rem;
             color: #343a40;
-        }}
-        h2.task-title {{
+        }
+        h2.task-title {
             margin: 32px 0 12px 0;
             font-size: 1.5rem;
             color: #343a40;
             padding-bottom: 6px;
             border-bottom: 2px solid var(--border);
-        }}
-        .table-container {{
+        }
+        .table-container {
             overflow-x: auto;
             border-radius: 10px;
             box-shadow: 0 4px 8px rgba(0,0,0,0.1);
             background: var(--card);
             margin-bottom: 22px;
-        }}
-        table.model-zoo-table {{
+        }
+        table.model-zoo-table {
             border-collapse: collapse;
             width: 100%;
             font-size: 0.92rem;
             table-layout: auto;
-        }}
-        table.model-zoo-table th, table.model-zoo-table td {{
+        }
+        table.model-zoo-table th, table.model-zoo-table td {
             border: 1px solid var(--border);
             padding: 10px 12px;
             text-align: center;
             vertical-align: middle;
             white-space: nowrap;
-        }}
-        table.model-zoo-table thead th {{
+        }
+        table.model-zoo-table thead th {
             background: #e9ecef;
             color: #6c757d;
             font-weight: 600;
             position: sticky;
             top: 0;
             z-index: 1;
-        }}
-        table.model-zoo-table tbody tr:nth-of-type(even) {{
+        }
+        table.model-zoo-table tbody tr:nth-of-type(even) {
             background-color: #f8f9fa;
-        }}
-        table.model-zoo-table tbody tr:hover {{
+        }
+        table.model-zoo-table tbody tr:hover {
             background-color: #f3f5f7;
-        }}
-        table.model-zoo-table a {{
+        }
+        table.model-zoo-table a {
             text-decoration: none;
             color: var(--accent);
             font-weight: 500;
-        }}
-        table.model-zoo-table a:hover {{ text-decoration: underline; }}
-        table.model-zoo-table td {{
+        }
+        table.model-zoo-table a:hover { text-decoration: underline; }
+        table.model-zoo-table td {
             padding: 0;
-        }}
-        table.model-zoo-table td div {{
+        }
+        table.model-zoo-table td div {
             border-bottom: 1px solid var(--border);
             padding: 10px 12px;
             white-space: nowrap;
-        }}
-        table.model-zoo-table td div:last-child {{
+        }
+        table.model-zoo-table td div:last-child {
             border-bottom: none;
-        }}
-        @media (max-width: 768px) {{
-            table.model-zoo-table th, table.model-zoo-table td {{
+        }
+        @media (max-width: 768px) {
+            table.model-zoo-table th, table.model-zoo-table td {
                 padding: 8px 10px;
                 font-size: 0.88rem;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <h1>DX Model Zoo</h1>
-    {body}
+    """
+
+HTML_TAIL = """
 </body>
 </html>
 """
 
 
+def build_full_html(body: str) -> str:
+    """
+    전체 HTML 문서 스켈레톤 + 스타일
+    """
+    return HTML_HEAD + body + HTML_TAIL
+
+
+def _temp_sibling(path: Path) -> Path:
+    """path 와 같은 폴더의 임시 파일 경로 (다 쓴 뒤 os.replace 로 교체하는 용도)"""
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def write_full_html(sections, html_path: Path) -> None:
+    """
+    섹션 HTML 을 하나씩 UTF-8 로 인코딩해 1MB 버퍼로 기록한다 (문서 전체를 한 문자열/바이트로 만들지 않음).
+    줄바꿈은 플랫폼과 무관하게 LF 로 기록된다.
+    결과는 build_full_html("\\n".join(sections)) 와 동일.
+    같은 폴더의 임시 파일에 다 쓴 뒤 os.replace 로 교체하므로, 렌더링 도중 실패해도 기존 HTML 은 그대로 남는다.
+    """
+    tmp_path = _temp_sibling(html_path)
+    try:
+        with open(tmp_path, "wb", buffering=0) as raw, io.BufferedWriter(raw, buffer_size=1 << 20) as buf:
+            fp = codecs.getwriter("utf-8")(buf)
+            fp.write(HTML_HEAD)
+            for i, section in enumerate(sections):
+                if i:
+                    fp.write("\n")
+                fp.write(section)
+            fp.write(HTML_TAIL)
+        os.replace(tmp_path, html_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def used_csv_columns(csv_path: Path) -> list | None:
+    """
+    CSV 헤더만 먼저 읽어 파이프라인에서 쓰는 컬럼 이름 목록을 반환 (read_csv 의 usecols 용).
+    헤더에 중복 이름이 있거나 해당 컬럼이 하나도 없으면 None (전체 읽기).
+    """
+    with csv_path.open(newline="", encoding="utf-8-sig") as fp:
+        header = next(csv.reader(fp), [])
+    if len(set(header)) != len(header):
+        return None
+    wanted = [c for c in header if c.strip().lower() in _USED_COLUMN_KEYS]
+    return wanted or None
+
+
+# 생성된 HTML 결과 캐시 (출력 파일과 같은 폴더 아래)
+HTML_CACHE_DIR = ".csv2html_cache"
+HTML_CACHE_MAX_ENTRIES = 16
+
+
+def _input_cache_key(csv_path: Path, meta_path: Path | None) -> tuple:
+    """입력 CSV / 메타 파일 / 이 스크립트 자체가 바뀌면 달라지는 캐시 키"""
+    return _file_signature(csv_path) + _file_signature(meta_path) + _file_signature(Path(__file__))
+
+
+def _html_cache_path(html_path: Path, csv_path: Path, key: tuple) -> Path:
+    """출력 폴더의 HTML_CACHE_DIR 아래, (CSV 경로 + 캐시 키) 해시 이름의 HTML 캐시 경로"""
+    digest = hashlib.sha1(f"{csv_path.resolve()}:{key}".encode("utf-8")).hexdigest()
+    return html_path.parent / HTML_CACHE_DIR / f"{digest}.html"
+
+
+def _restore_html_cache(cached: Path, html_path: Path) -> bool:
+    """
+    캐시된 HTML 이 있으면 html_path 로 복사하고 True (최근 사용 표시를 위해 mtime 갱신)
+    write_full_html 과 같이 임시 파일로 복사한 뒤 os.replace 로 교체한다.
+    """
+    if not cached.exists():
+        return False
+    tmp_path = _temp_sibling(html_path)
+    try:
+        shutil.copyfile(cached, tmp_path)
+        os.replace(tmp_path, html_path)
+        os.utime(cached)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _store_html_cache(html_path: Path, cached: Path) -> None:
+    """생성한 HTML 을 캐시에 저장하고, 오래 안 쓴 항목부터 HTML_CACHE_MAX_ENTRIES 개만 남긴다"""
+    try:
+        cached.parent.mkdir(exist_ok=True)
+        shutil.copyfile(html_path, cached)
+        entries = sorted(cached.parent.glob("*.html"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for old in entries[HTML_CACHE_MAX_ENTRIES:]:
+            old.unlink()
+    except OSError:
+        pass
+
+
 def generate_model_zoo_html(csv_path: Path, html_path: Path, meta_path: Path | None = None) -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"Input CSV not found: {csv_path}")
 
     print(f"meta = {meta_path}")
-    df_raw = pd.read_csv(csv_path)
+    # 없는 메타 파일과 meta_path=None 은 캐시 키가 같으므로, 캐시 조회 전에 load_meta 와 같은 오류를 낸다
+    if meta_path is not None and not meta_path.exists():
+        raise FileNotFoundError(f"Enrichment file not found: {meta_path}")
+    cache_key = _input_cache_key(csv_path, meta_path)
+
+    # 같은 입력으로 만든 HTML 이 캐시에 있으면 복사만 하고 끝낸다
+    html_cache = _html_cache_path(html_path, csv_path, cache_key)
+    if _restore_html_cache(html_cache, html_path):
+        print(f"[OK] Generated: {html_path} (cached)")
+        return
+
+    try:
+        df_raw = read_csv_table(csv_path, usecols=used_csv_columns(csv_path))
+    except ValueError:
+        # 헤더 해석이 엔진과 다르면(usecols 불일치 등) 전체 컬럼으로 다시 읽는다
+        df_raw = read_csv_table(csv_path)
     df_processed = normalize_and_process(df_raw, meta_path=meta_path)
-    body_html = dataframe_grouped_html(df_processed)
-    html = build_full_html(body_html)
-    html_path.write_text(html, encoding="utf-8")
+    write_full_html(iter_grouped_sections(df_processed), html_path)
+    _store_html_cache(html_path, html_cache)
     print(f"[OK] Generated: {html_path}")
 
 